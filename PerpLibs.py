@@ -5,11 +5,14 @@ import logging
 
 load_dotenv()
 
+# Overridable so benchmarks and offline environments can point at a local stub
+API_URL = os.getenv('PERPLEXITY_API_URL', "https://api.perplexity.ai/chat/completions")
+
 def Request(query):
     '''
     takes in a request as a string, outputs full JSON
     '''
-    url = "https://api.perplexity.ai/chat/completions"
+    url = API_URL
 
     payload = {
         "model": "sonar",
@@ -50,7 +53,7 @@ def AnalyzeData(Datatype, context ,raw):
     Asks perplexity to analyze a certain input datatype (eg. csv) for a context (eg. abnormal datapoints)
     and then takes in the raw data as a third argument. Returns the full json file
     '''
-    url = "https://api.perplexity.ai/chat/completions"
+    url = API_URL
 
     payload = {
         "model": "sonar",
@@ -1,16 +1,23 @@
 """Budget Buddy Flask application for managing personal budget items and expenditures."""
 
-import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from flask import Flask, render_template, request, redirect, jsonify, session
 import sqlalchemy
 from flask_sqlalchemy import SQLAlchemy
 from markdown import markdown
 from waitress import serve
+from werkzeug.exceptions import HTTPException
 from werkzeug.security import generate_password_hash, check_password_hash
 from PerpLibs import Request, Textonly
+from money import cents_to_dollars, format_cents, migrate_to_cents, parse_cents
+from search import create_search_index, is_search_supported, search_expenses
+import logconfig
+import compression
+import fragment_cache
+import profiling
+import static_assets
 
 import os
 from dotenv import load_dotenv
@@ -18,15 +25,21 @@ from dotenv import load_dotenv
 load_dotenv()
 
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///test.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///test.db')
 app.config['SECRET_KEY'] = os.getenv('ServerSecret')
 db = SQLAlchemy(app)
+logconfig.init_app(app)
+profiling.init_app(app)
+static_assets.init_app(app)
+compression.init_app(app)
+
+DEFAULT_BUDGET_CENTS = 200000
 
 class Todo(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     item = db.Column(db.String(200), nullable=False)  # Category
     name = db.Column(db.String(200), nullable=False, default="Unnamed Item")  # Item name
-    cost = db.Column(db.Float, nullable=False)
+    cost_cents = db.Column(db.Integer, nullable=False)  # Cost in cents
     date_created = db.Column(db.DateTime, default=datetime.now)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
 
@@ -35,12 +48,12 @@ class Todo(db.Model):
 
 class Budget(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    monthly_amount = db.Column(db.Float, nullable=False, default=2000.0)
+    monthly_amount_cents = db.Column(db.Integer, nullable=False, default=DEFAULT_BUDGET_CENTS)
     date_updated = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
 
     def __repr__(self):
-        return f'<Budget ${self.monthly_amount}>'
+        return f'<Budget ${format_cents(self.monthly_amount_cents)}>'
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -54,6 +67,9 @@ class User(db.Model):
     def __repr__(self):
         return f'<User {self.username}>'
 
+fragment_cache.init_app(app, models=(Todo, Budget))
+app.jinja_env.filters['dollars'] = format_cents
+
 @app.route("/", methods=['GET'])
 @app.route("/index", methods=['GET'])
 def index():
@@ -71,7 +87,7 @@ def login():
             username = request.form.get('username')
             password = request.form.get('password')
             
-            app.logger.info(f"Login attempt for username: {username}")
+            app.logger.info("Login attempt for username: %s", username, extra={'audit': True})
             
             if not username or not password:
                 error_message = "Username and password are required"
@@ -84,13 +100,13 @@ def login():
                     session['logged_in'] = True
                     session['username'] = user.username
                     session['user_id'] = user.id
-                    app.logger.info(f"Login successful for username: {username}")
+                    app.logger.info("Login successful for username: %s", username, extra={'audit': True, 'user_id': user.id})
                     return redirect('/dashboard')
                 else:
                     error_message = "Invalid username or password"
-                    app.logger.warning(f"Failed login attempt for username: {username}")
+                    app.logger.warning("Failed login attempt for username: %s", username)
     except Exception as e:
-        app.logger.error(f"Login error: {str(e)}")
+        app.logger.error("Login error: %s", e)
         error_message = "An error occurred during login. Please try again."
     
     return render_template('login.html', error_message=error_message)
@@ -112,7 +128,7 @@ def register():
             email = request.form.get('email')
             password = request.form.get('password')
             
-            app.logger.info(f"Registration attempt for username: {username}, email: {email}")
+            app.logger.info("Registration attempt for username: %s, email: %s", username, email, extra={'audit': True})
             
             # Basic validation
             if not username or not email or not password:
@@ -122,7 +138,7 @@ def register():
             # Check if username or email already exists
             existing_user = User.query.filter((User.username == username) | (User.email == email)).first()
             if existing_user:
-                app.logger.warning(f"Registration attempt with existing username or email: {username}, {email}")
+                app.logger.warning("Registration attempt with existing username or email: %s, %s", username, email)
                 return render_template('login.html', error_message="Username or email already exists")
             
             # Create new user with hashed password using SHA-256
@@ -133,7 +149,7 @@ def register():
                 db.session.add(new_user)
                 db.session.commit()
                 
-                app.logger.info(f"User created successfully: {username}")
+                app.logger.info("User created successfully: %s", username, extra={'audit': True, 'user_id': new_user.id})
                 
                 # Log the user in - make sure to set the user_id
                 session['logged_in'] = True
@@ -141,19 +157,19 @@ def register():
                 session['user_id'] = new_user.id
                 
                 # Create a default budget for the new user
-                default_budget = Budget(monthly_amount=2000.0, user_id=new_user.id)
+                default_budget = Budget(monthly_amount_cents=DEFAULT_BUDGET_CENTS, user_id=new_user.id)
                 db.session.add(default_budget)
                 db.session.commit()
                 
-                app.logger.info(f"Default budget created for user: {username}")
+                app.logger.info("Default budget created for user: %s", username)
                 
                 return redirect('/dashboard')
             except Exception as e:
                 db.session.rollback()
-                app.logger.error(f"Database error creating user: {e}")
+                app.logger.error("Database error creating user: %s", e)
                 return render_template('login.html', error_message=f"Registration failed: {str(e)}")
     except Exception as e:
-        app.logger.error(f"Registration error: {str(e)}")
+        app.logger.error("Registration error: %s", e)
         return render_template('login.html', error_message="An error occurred during registration. Please try again.")
     
     # GET requests are redirected to login page where the registration form exists
@@ -168,6 +184,20 @@ def login_required(f):
     decorated_function.__name__ = f.__name__
     return decorated_function
 
+def category_totals(user_id):
+    """Return ({category: total cents}, expense count) for a user, summed in SQL and ordered by category."""
+    rows = db.session.query(Todo.item, db.func.sum(Todo.cost_cents), db.func.count(Todo.id)) \
+        .filter_by(user_id=user_id).group_by(Todo.item).order_by(Todo.item).all()
+    return {category: total for category, total, _ in rows}, sum(count for _, _, count in rows)
+
+def spending_table(items):
+    """Format expenses and their total for inclusion in an AI prompt."""
+    table = "\nCurrent Spending Items:\n"
+    for item in items:
+        table += f"- {item.item}: ${format_cents(item.cost_cents)}\n"
+    table += f"\nTotal Spending: ${format_cents(sum(item.cost_cents for item in items))}\n"
+    return table
+
 @app.route("/dashboard", methods=['GET', 'POST'])
 @login_required
 def dashboard():
@@ -179,9 +209,9 @@ def dashboard():
         item_date = request.form.get('date')
         
         try:
-            item_cost = float(item_cost)
+            item_cost = parse_cents(item_cost)
             user_id = session.get('user_id')
-            new_item = Todo(item=item_category, name=item_name, cost=item_cost, user_id=user_id)
+            new_item = Todo(item=item_category, name=item_name, cost_cents=item_cost, user_id=user_id)
             
             # Set custom date if provided, otherwise use current date
             if item_date:
@@ -198,23 +228,17 @@ def dashboard():
             return 'Invalid cost value'
     
     user_id = session.get('user_id')
-    items = Todo.query.filter_by(user_id=user_id).all()
-    total_spent = sum(item.cost for item in items)
+
+    # Calculate basic statistics in SQL, in exact integer cents
+    category_data, item_count = category_totals(user_id)
+    total_spent = sum(category_data.values())
     
     # Get current budget - fetch user-specific budget
     budget = Budget.query.filter_by(user_id=user_id).first()
-    monthly_budget = budget.monthly_amount if budget else 2000.0
+    monthly_budget = budget.monthly_amount_cents if budget else DEFAULT_BUDGET_CENTS
     
-    # Calculate basic statistics
-    category_data = {}
-    for item in items:
-        if item.item in category_data:
-            category_data[item.item] += item.cost
-        else:
-            category_data[item.item] = item.cost
-    
-    # Sort items by date (most recent first)
-    recent_items = sorted(items, key=lambda x: x.date_created, reverse=True)[:5]
+    # Most recent items first, left unevaluated so a cached recent-items fragment never loads them
+    recent_items = Todo.query.filter_by(user_id=user_id).order_by(Todo.date_created.desc()).limit(5)
     
     # Get today's date for the date input default
     today_date = datetime.now().strftime('%Y-%m-%d')
@@ -223,7 +247,7 @@ def dashboard():
     username = session.get('username', 'Demo User')
     
     return render_template('dashboard.html', 
-                          items=items,
+                          item_count=item_count,
                           recent_items=recent_items,
                           total_spent=total_spent,
                           category_data=category_data,
@@ -243,9 +267,9 @@ def expenses():
         item_date = request.form.get('date')
         
         try:
-            item_cost = float(item_cost)
+            item_cost = parse_cents(item_cost)
             user_id = session.get('user_id')
-            new_item = Todo(item=item_category, name=item_name, cost=item_cost, user_id=user_id)
+            new_item = Todo(item=item_category, name=item_name, cost_cents=item_cost, user_id=user_id)
             
             # Set custom date if provided, otherwise use current date
             if item_date:
@@ -262,7 +286,8 @@ def expenses():
             return 'Invalid cost value'
     
     user_id = session.get('user_id')
-    items = Todo.query.filter_by(user_id=user_id).order_by(Todo.date_created.desc()).all()
+    # Left unevaluated so a cached expense-rows fragment never loads the rows
+    items = Todo.query.filter_by(user_id=user_id).order_by(Todo.date_created.desc())
     
     # Get today's date for the date input default
     today_date = datetime.now().strftime('%Y-%m-%d')
@@ -278,15 +303,11 @@ def expenses():
 def categories():
     """Display expense categories."""
     user_id = session.get('user_id')
-    items = Todo.query.filter_by(user_id=user_id).all()
+    # Left unevaluated so a cached category-items fragment never loads the rows
+    items = Todo.query.filter_by(user_id=user_id)
     
     # Categorize spending
-    category_data = {}
-    for item in items:
-        if item.item in category_data:
-            category_data[item.item] += item.cost
-        else:
-            category_data[item.item] = item.cost
+    category_data, _ = category_totals(user_id)
     
     # Get username from session
     username = session.get('username', 'Demo User')
@@ -297,6 +318,48 @@ def categories():
                           username=username)
 
 
+@app.route('/search', methods=['GET'])
+@login_required
+def search():
+    """Search the user's expenses by name and category, optionally filtered by date and cost."""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'Please provide a search query', 'results': []}), 400
+    if not is_search_supported(db.engine):
+        return jsonify({'error': 'Search is not available for this database', 'results': []}), 501
+
+    try:
+        date_from = request.args.get('date_from')
+        date_to = request.args.get('date_to')
+        date_from = datetime.strptime(date_from, '%Y-%m-%d') if date_from else None
+        # date_to is inclusive, so search up to the start of the following day
+        date_to = datetime.strptime(date_to, '%Y-%m-%d') + timedelta(days=1) if date_to else None
+        min_cost = request.args.get('min_cost')
+        max_cost = request.args.get('max_cost')
+        min_cost = parse_cents(min_cost) if min_cost else None
+        max_cost = parse_cents(max_cost) if max_cost else None
+        limit = min(max(int(request.args.get('limit', 50)), 1), 200)
+    except (ValueError, OverflowError) as e:  # OverflowError: date_to=9999-12-31 plus one day
+        app.logger.warning("Invalid search parameters: %s", e)
+        return jsonify({'error': 'Invalid search parameters', 'results': []}), 400
+
+    try:
+        with db.engine.connect() as conn:
+            rows = search_expenses(conn, session.get('user_id'), query, date_from=date_from, date_to=date_to,
+                                   min_cost=min_cost, max_cost=max_cost, limit=limit)
+    except sqlalchemy.exc.SQLAlchemyError as e:
+        app.logger.error("Search error: %s", e)
+        return jsonify({'error': 'There was an issue searching your expenses', 'results': []}), 500
+
+    results = [{'id': row.id,
+                'item': row.item,
+                'name': row.name,
+                'cost': format_cents(row.cost_cents),
+                'date': row.date_created.strftime('%Y-%m-%d')}
+               for row in rows]
+    return jsonify({'results': results})
+
+
 @app.route('/delete/<int:item_id>')
 @login_required
 def delete(item_id):
@@ -321,7 +384,10 @@ def update(item_id):
     if request.method == 'POST':
         item.item = request.form['item']
         item.name = request.form.get('name', 'Unnamed Item')
-        item.cost = float(request.form.get('cost', 0))
+        try:
+            item.cost_cents = parse_cents(request.form.get('cost', 0))
+        except ValueError:
+            return 'Invalid cost value'
         item_date = request.form.get('date')
         
         # Update date if provided
@@ -351,11 +417,14 @@ def insights():
     prompt_result = None
     user_id = session.get('user_id')
     
-    # Get user's items and budget
-    items = Todo.query.filter_by(user_id=user_id).order_by(Todo.date_created).all()
+    # Get user's spending and budget. Only the columns the charts need are
+    # loaded, full rows are only fetched for the AI prompt.
+    items = db.session.query(Todo.date_created, Todo.cost_cents) \
+        .filter_by(user_id=user_id).order_by(Todo.date_created).all()
+    category_data, item_count = category_totals(user_id)
     budget = Budget.query.filter_by(user_id=user_id).first()
-    monthly_budget = budget.monthly_amount if budget else 2000.0
-    total_spent = sum(item.cost for item in items)
+    monthly_budget = budget.monthly_amount_cents if budget else DEFAULT_BUDGET_CENTS
+    total_spent = sum(category_data.values())
     
     # --- NEW: Daily Spending Aggregation ---
     daily_totals = {}
@@ -363,11 +432,11 @@ def insights():
         day = item.date_created.strftime('%Y-%m-%d')  # Group by date
         if day not in daily_totals:
             daily_totals[day] = 0
-        daily_totals[day] += item.cost
+        daily_totals[day] += item.cost_cents
     
     # Sort days and prepare data for chart
     sorted_days = sorted(daily_totals.keys())
-    daily_amounts = [daily_totals[day] for day in sorted_days]
+    daily_amounts = [cents_to_dollars(daily_totals[day]) for day in sorted_days]
     
     # Format dates for display (e.g., "Jan 01")
     formatted_days = [datetime.strptime(day, '%Y-%m-%d').strftime('%b %d') for day in sorted_days]
@@ -381,13 +450,13 @@ def insights():
         week_key = f"{item.date_created.strftime('%Y')}-W{item.date_created.strftime('%W')}"
         if week_key not in weekly_totals:
             weekly_totals[week_key] = 0
-        weekly_totals[week_key] += item.cost
+        weekly_totals[week_key] += item.cost_cents
         
         # Monthly aggregation (Year-Month)
         month_key = item.date_created.strftime('%Y-%m')
         if month_key not in monthly_totals:
             monthly_totals[month_key] = 0
-        monthly_totals[month_key] += item.cost
+        monthly_totals[month_key] += item.cost_cents
     
     # --- Existing AI Query Handling ---
     if request.method == 'POST':
@@ -397,20 +466,15 @@ def insights():
             full_query = user_query + restrictions
             
             # Get current spending data from the database
-            current_spending_table = "\nCurrent Spending Items:\n"
-            total_cost = 0
-            
-            for item in items:
-                current_spending_table += f"- {item.item}: ${item.cost}\n"
-                total_cost += item.cost
-                
-            current_spending_table += f"\nTotal Spending: ${total_cost}\n"
+            current_spending_table = spending_table(
+                Todo.query.filter_by(user_id=user_id).order_by(Todo.date_created).all())
             
             full_query += current_spending_table
             
             # Process the query using Perplexity API
             try:
-                response = Request(full_query)
+                with profiling.track_ai_call():
+                    response = Request(full_query)
                 prompt_result = Textonly(response)  # Extract text from API response
                 prompt_result = re.sub(r'\[\d+\]', '', prompt_result)
                 
@@ -420,23 +484,11 @@ def insights():
                 app.logger.error("Perplexity API error: %s", e)
                 prompt_result = f"Error connecting to AI service: {str(e)}"
     
-    # Categorize spending
-    category_data = {}
-    for item in items:
-        if item.item in category_data:
-            category_data[item.item] += item.cost
-        else:
-            category_data[item.item] = item.cost
-    
     # Find highest spending category
     highest_category = max(category_data.items(), key=lambda x: x[1]) if category_data else ("None", 0)
     
-    # Get recent items (last 5)
-    recent_items = items[-5:] if len(items) > 5 else items
-    
     return render_template('insights.html', 
-                          items=items,
-                          recent_items=recent_items,
+                          item_count=item_count,
                           total_spent=total_spent,
                           category_data=category_data,
                           highest_category=highest_category,
@@ -446,20 +498,22 @@ def insights():
                           # NEW: Chart data
                           daily_labels=formatted_days,
                           daily_amounts=daily_amounts,
-                          weekly_totals=weekly_totals,
-                          monthly_totals=monthly_totals,
+                          weekly_totals={week: cents_to_dollars(total) for week, total in weekly_totals.items()},
+                          monthly_totals={month: cents_to_dollars(total) for month, total in monthly_totals.items()},
                           # For date display
                           today_date=datetime.now().strftime('%Y-%m-%d'))
 
 @app.errorhandler(500)
 def internal_error(error):
     db.session.rollback()
-    app.logger.error(f"Internal server error: {error}")
+    app.logger.error("Internal server error: %s", error)
     return render_template('login.html', error_message="An internal server error occurred. Please try again."), 500
 
 @app.errorhandler(Exception)
 def handle_exception(e):
-    app.logger.error(f"Unhandled exception: {str(e)}")
+    if isinstance(e, HTTPException):
+        return e
+    app.logger.exception("Unhandled exception: %s", e)
     db.session.rollback()
     return render_template('login.html', error_message="An unexpected error occurred. Please try again."), 500
 
@@ -480,20 +534,14 @@ def submit():
         # Get current spending data from the database
         user_id = session.get('user_id')
         items = Todo.query.filter_by(user_id=user_id).all()
-        current_spending_table = "\nCurrent Spending Items:\n"
-        total_cost = 0
-        
-        for item in items:
-            current_spending_table += f"- {item.item}: ${item.cost}\n"
-            total_cost += item.cost
-            
-        current_spending_table += f"\nTotal Spending: ${total_cost}\n"
+        current_spending_table = spending_table(items)
         
         user_query += current_spending_table
         
         # Process the query using Perplexity API
         try:
-            response = Request(user_query)
+            with profiling.track_ai_call():
+                response = Request(user_query)
             prompt_result = Textonly(response)  # Extract text from API response
             prompt_result = re.sub(r'\[\d+\]', '', prompt_result)
             
@@ -539,7 +587,7 @@ def migrate_db():
         db.session.commit()
         return "Database migration completed successfully."
     except Exception as e:
-        app.logger.error(f"Migration error: {str(e)}")
+        app.logger.error("Migration error: %s", e)
         return f"Migration failed: {str(e)}"
 
 @app.route("/set_budget", methods=['POST'])
@@ -547,15 +595,15 @@ def migrate_db():
 def set_budget():
     """Update the monthly budget amount."""
     try:
-        new_budget = float(request.form.get('monthly_budget', 2000))
+        new_budget = parse_cents(request.form.get('monthly_budget', 2000))
         user_id = session.get('user_id')
         
         # Get the current budget for this user or create a new one if it doesn't exist
         budget = Budget.query.filter_by(user_id=user_id).first()
         if budget:
-            budget.monthly_amount = new_budget
+            budget.monthly_amount_cents = new_budget
         else:
-            budget = Budget(monthly_amount=new_budget, user_id=user_id)
+            budget = Budget(monthly_amount_cents=new_budget, user_id=user_id)
             db.session.add(budget)
             
         db.session.commit()
@@ -568,7 +616,7 @@ def set_budget():
     except ValueError:
         return "Please enter a valid number for the budget"
     except Exception as e:
-        app.logger.error(f"Error setting budget: {e}")
+        app.logger.error("Error setting budget: %s", e)
         return "An error occurred while setting the budget"
 
 @app.route("/get_ai_insights", methods=['POST'])
@@ -583,41 +631,33 @@ def get_ai_insights():
         
         # Get spending data
         user_id = session.get('user_id')
-        items = Todo.query.filter_by(user_id=user_id).all()
-        total_spent = sum(item.cost for item in items)
+        category_data, _ = category_totals(user_id)
+        total_spent = sum(category_data.values())
         
         # Get current budget - fetch user-specific budget
         budget = Budget.query.filter_by(user_id=user_id).first()
-        monthly_budget = budget.monthly_amount if budget else 2000.0
-        
-        # Categorize spending
-        category_data = {}
-        for item in items:
-            if item.item in category_data:
-                category_data[item.item] += item.cost
-            else:
-                category_data[item.item] = item.cost
+        monthly_budget = budget.monthly_amount_cents if budget else DEFAULT_BUDGET_CENTS
         
         # Build a query based on spending patterns
         query = "Give 1-2 short personalized budget tips based on the following information:"
         
         # Include general budget status
-        query += f"\nTotal spending: ${total_spent:.2f}, Monthly budget: ${monthly_budget:.2f}"
+        query += f"\nTotal spending: ${format_cents(total_spent)}, Monthly budget: ${format_cents(monthly_budget)}"
         
         # Include category-specific information if available
         if category and category in category_data:
-            query += f"\nSpending on {category}: ${category_data[category]:.2f}"
+            query += f"\nSpending on {category}: ${format_cents(category_data[category])}"
             
             # Find similar items in the same category
-            similar_items = [i for i in items if i.item == category]
+            similar_items = Todo.query.filter_by(user_id=user_id, item=category).limit(5).all()  # Limit to 5 examples
             if similar_items:
                 query += f"\nOther {category} expenses:"
-                for item in similar_items[:5]:  # Limit to 5 examples
-                    query += f"\n- {item.name}: ${item.cost:.2f}"
+                for item in similar_items:
+                    query += f"\n- {item.name}: ${format_cents(item.cost_cents)}"
         
         # Include information about the newly added item if available
         if category and item_name and cost:
-            query += f"\nNew expense just added: {item_name} (Category: {category}) for ${float(cost):.2f}"
+            query += f"\nNew expense just added: {item_name} (Category: {category}) for ${format_cents(parse_cents(cost))}"
             
         # Make sure the tips are focused on the specific category if available
         if category:
@@ -628,7 +668,8 @@ def get_ai_insights():
         query += restrictions
         
         # Process the query using Perplexity API
-        response = Request(query)
+        with profiling.track_ai_call():
+            response = Request(query)
         ai_response = Textonly(response)
         
         # Clean up the response
@@ -643,7 +684,7 @@ def get_ai_insights():
         
         return jsonify({'insights': ai_response})
     except Exception as e:
-        app.logger.error(f"Error generating AI insights: {e}")
+        app.logger.error("Error generating AI insights: %s", e)
         return jsonify({'insights': f"<p>Error generating insights: {str(e)}</p>"}), 500
 
 # Create database tables with proper user_id foreign key support
@@ -660,6 +701,16 @@ with app.app_context():
         # Just make sure all tables are created without dropping
         db.create_all()
         app.logger.info("Database tables already exist, ensuring all tables are created")
+
+    # Money used to be stored as floating-point dollars; convert it to integer cents
+    for table, old_column, new_column in (('todo', 'cost', 'cost_cents'),
+                                          ('budget', 'monthly_amount', 'monthly_amount_cents')):
+        if migrate_to_cents(db.engine, table, old_column, new_column):
+            app.logger.info("Converted %s.%s to integer cents", table, old_column)
+
+    # Full-text search index over expense names and categories (SQLite only)
+    if create_search_index(db.engine):
+        app.logger.info("Built full-text search index for expenses")
     
     # Check if we have any users
     user_count = User.query.count()
@@ -675,7 +726,7 @@ with app.app_context():
         db.session.commit()
         
         # Create default budget
-        default_budget = Budget(monthly_amount=2000.0)
+        default_budget = Budget(monthly_amount_cents=DEFAULT_BUDGET_CENTS, user_id=demo_user.id)
         db.session.add(default_budget)
         db.session.commit()
         
@@ -687,15 +738,13 @@ with app.app_context():
                 todo.user_id = demo_user_id
             db.session.commit()
             if orphan_todos:
-                app.logger.info(f"Assigned {len(orphan_todos)} existing Todo items to demo user")
+                app.logger.info("Assigned %d existing Todo items to demo user", len(orphan_todos))
         except Exception as e:
-            app.logger.error(f"Error migrating orphan todos: {e}")
+            app.logger.error("Error migrating orphan todos: %s", e)
         
         app.logger.info("Created demo user and default budget")
     else:
-        app.logger.info(f"Database has {user_count} existing users")
+        app.logger.info("Database has %d existing users", user_count)
 
 if __name__ == "__main__":
-    # Configure logging
-    logging.basicConfig(level=logging.DEBUG)
     serve(app, host="0.0.0.0", port=8000)
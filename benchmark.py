@@ -0,0 +1,248 @@
+"""Reproducible benchmark for the Budget Buddy hot routes.
+
+Drives the app through the Flask test client against a database populated by
+seed_data.py and reports latency percentiles, throughput, SQL query counts and
+peak Python memory for each route. The AI routes talk to a local stub of the
+Perplexity API so results do not depend on the network.
+
+    python seed_data.py --database sqlite:///bench.db --users 100 --reset
+    python benchmark.py --database sqlite:///bench.db --output bench_before.json
+    python benchmark.py --database sqlite:///bench.db --output bench_after.json --compare bench_before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_ANSWER = ("Your largest category is **Groceries** [1]. Try planning meals for the week "
+               "and buying staples in bulk to cut that spend by around 10%.")
+
+# name -> (method, path, form data, JSON body)
+ROUTES = {
+    'dashboard': ('GET', '/dashboard', None, None),
+    'expenses': ('GET', '/expenses', None, None),
+    'categories': ('GET', '/categories', None, None),
+    'insights': ('GET', '/insights', None, None),
+    'search': ('GET', '/search?q=gro&min_cost=10', None, None),
+    'search_heavy': ('GET', '/search?q=s', None, None),
+    'insights_ai': ('POST', '/insights', {'query': 'Where can I cut back this month?'}, None),
+    'submit': ('POST', '/submit', None, {'userQuery': 'Am I on track with my budget?'}),
+    'get_ai_insights': ('POST', '/get_ai_insights', None,
+                        {'category': 'Groceries', 'name': 'Supermarket', 'cost': '54.20'}),
+}
+
+# Routes that always run as the user with the most expenses rather than the sampled users
+HEAVY_USER_ROUTES = {'search_heavy'}
+
+
+class StubPerplexityHandler(BaseHTTPRequestHandler):
+    """Answers every chat completion request with a fixed response."""
+
+    latency = 0.0
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+        if self.latency:
+            time.sleep(self.latency)
+        body = json.dumps({
+            'choices': [{'message': {'role': 'assistant', 'content': STUB_ANSWER}}],
+            'citations': ['https://example.com/budgeting'],
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(latency_ms):
+    """Start the Perplexity stub on a free local port and return the server."""
+    StubPerplexityHandler.latency = latency_ms / 1000
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubPerplexityHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Budget Buddy hot routes.")
+    parser.add_argument('--database', default='sqlite:///bench.db',
+                        help="SQLAlchemy database URI populated by seed_data.py (default: %(default)s)")
+    parser.add_argument('--routes', nargs='+', choices=sorted(ROUTES), default=list(ROUTES),
+                        help="routes to benchmark (default: all)")
+    parser.add_argument('--requests', type=int, default=50, help="timed requests per route")
+    parser.add_argument('--warmup', type=int, default=5, help="untimed warm-up requests per route")
+    parser.add_argument('--memory-requests', type=int, default=5,
+                        help="extra requests per route measured under tracemalloc")
+    parser.add_argument('--sample-users', type=int, default=20, help="how many users to spread requests over")
+    parser.add_argument('--stub-latency-ms', type=float, default=0.0, help="simulated Perplexity API latency")
+    parser.add_argument('--seed', type=int, default=42, help="random seed for user selection")
+    parser.add_argument('--output', default='bench_results.json', help="where to write the JSON results")
+    parser.add_argument('--compare', help="previous results file to compare against")
+    return parser.parse_args(argv)
+
+
+def run(args):
+    """Run the benchmark and return the results as a dictionary."""
+    stub = start_stub_server(args.stub_latency_ms)
+    # Both modules read their configuration at import time. Log to a scratch
+    # file rather than the app's error.log.
+    os.environ['DATABASE_URL'] = args.database
+    os.environ['PERPLEXITY_API_URL'] = f'http://127.0.0.1:{stub.server_port}/chat/completions'
+    os.environ.setdefault('ServerSecret', 'benchmark-secret')
+    os.environ.setdefault('LOG_FILE', os.path.join(tempfile.gettempdir(), 'budgetbuddy-benchmark.log'))
+
+    import sqlalchemy
+    from app import app, db, User, Todo
+
+    if app.config['SQLALCHEMY_DATABASE_URI'] != args.database:
+        raise RuntimeError(f"app is configured for {app.config['SQLALCHEMY_DATABASE_URI']}, "
+                           f"not {args.database}; run benchmark.py in a fresh process")
+
+    query_count = [0]
+
+    def count_query(*_):
+        query_count[0] += 1
+
+    sqlalchemy.event.listen(sqlalchemy.engine.Engine, 'before_cursor_execute', count_query)
+
+    with app.app_context():
+        user_rows = db.session.query(User.id, User.username).order_by(User.id).all()
+        expense_count = db.session.query(sqlalchemy.func.count(Todo.id)).scalar()
+        heavy_user_id, heavy_user_expenses = db.session.query(Todo.user_id, sqlalchemy.func.count()) \
+            .group_by(Todo.user_id).order_by(sqlalchemy.func.count().desc()).first() or (None, 0)
+    rng = random.Random(args.seed)
+    users = rng.sample(user_rows, min(args.sample_users, len(user_rows)))
+    heavy_user = next((user for user in user_rows if user.id == heavy_user_id), users[0])
+
+    client = app.test_client()
+
+    def issue(name, user):
+        method, path, form, body = ROUTES[name]
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+            sess['user_id'] = user.id
+            sess['username'] = user.username
+        response = client.open(path, method=method, data=form, json=body)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {path} returned {response.status_code}")
+        return response
+
+    results = {}
+    for name in args.routes:
+        route_users = [heavy_user] if name in HEAVY_USER_ROUTES else users
+        for i in range(args.warmup):
+            issue(name, route_users[i % len(route_users)])
+
+        latencies = []
+        queries = []
+        for i in range(args.requests):
+            user = route_users[i % len(route_users)]
+            query_count[0] = 0
+            start = time.perf_counter()
+            issue(name, user)
+            latencies.append((time.perf_counter() - start) * 1000)
+            queries.append(query_count[0])
+
+        # Measured separately because tracemalloc slows every allocation down
+        tracemalloc.start()
+        peak = 0
+        for i in range(args.memory_requests):
+            tracemalloc.reset_peak()
+            issue(name, route_users[i % len(route_users)])
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        results[name] = {
+            'requests': len(latencies),
+            'mean_ms': round(statistics.fmean(latencies), 3),
+            'p50_ms': round(percentile(latencies, 50), 3),
+            'p90_ms': round(percentile(latencies, 90), 3),
+            'p95_ms': round(percentile(latencies, 95), 3),
+            'p99_ms': round(percentile(latencies, 99), 3),
+            'max_ms': round(max(latencies), 3),
+            'throughput_rps': round(len(latencies) / (sum(latencies) / 1000), 2),
+            'sql_queries_mean': round(statistics.fmean(queries), 2),
+            'sql_queries_max': max(queries),
+            'peak_memory_kb': round(peak / 1024, 1),
+        }
+        print(f"{name:>16}: p50 {results[name]['p50_ms']:8.2f} ms  p95 {results[name]['p95_ms']:8.2f} ms  "
+              f"{results[name]['throughput_rps']:8.1f} req/s  {results[name]['sql_queries_mean']:5.1f} queries  "
+              f"{results[name]['peak_memory_kb']:9.1f} KiB peak", file=sys.stderr)
+
+    stub.shutdown()
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'database': args.database,
+            'users': len(user_rows),
+            'expenses': expense_count,
+            'sampled_users': len(users),
+            'heavy_user_expenses': heavy_user_expenses,
+            'requests_per_route': args.requests,
+            'stub_latency_ms': args.stub_latency_ms,
+            'seed': args.seed,
+        },
+        'routes': results,
+    }
+
+
+def compare(current, previous):
+    """Print the change in key metrics relative to a previous run."""
+    print(f"\nCompared with {previous['meta'].get('git_revision')} ({previous['meta'].get('timestamp')}):")
+    for name, now in current['routes'].items():
+        before = previous['routes'].get(name)
+        if not before:
+            continue
+        changes = []
+        for metric in ('p50_ms', 'p95_ms', 'sql_queries_mean', 'peak_memory_kb'):
+            if before[metric]:
+                changes.append(f"{metric} {(now[metric] - before[metric]) / before[metric] * 100:+.1f}%")
+        print(f"{name:>16}: " + ", ".join(changes))
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run(args)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""Build the self-hosted static asset bundle served from static/dist.
+
+Compiles a purged Tailwind stylesheet from the templates, bundles it with the
+vendored Font Awesome stylesheet, copies the vendored Chart.js build and then
+writes every file under a content-hash filename together with gzip (and, when
+the ``brotli`` package is installed, brotli) precompressed variants and a
+manifest.json that static_assets.py uses to resolve asset names.
+
+Third-party files are downloaded once into assets/vendor and reused from
+there, so after the first run (or with a committed assets/vendor directory)
+the build works offline:
+
+    python build_assets.py            # download anything missing, then build
+    python build_assets.py --offline  # only use assets/vendor
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import urllib.parse
+import urllib.request
+
+try:
+    import brotli
+except ImportError:  # optional, only gzip variants are written without it
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(ROOT, 'assets')
+VENDOR_DIR = os.path.join(ASSETS_DIR, 'vendor')
+DIST_DIR = os.path.join(ROOT, 'static', 'dist')
+
+TAILWIND_COMMAND = 'npx --yes tailwindcss@3.4.17'
+CHART_JS_URL = 'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js'
+FONT_AWESOME_URL = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.3/css/all.min.css'
+
+COMPRESSIBLE = ('.css', '.js', '.svg', '.ttf', '.eot', '.json')
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def fetch(url, path, offline):
+    """Return the vendored copy of ``url`` at ``path``, downloading it if needed."""
+    if not os.path.exists(path):
+        if offline:
+            sys.exit(f"{os.path.relpath(path, ROOT)} is missing and --offline was given")
+        print(f"Downloading {url}", file=sys.stderr)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with urllib.request.urlopen(url, timeout=60) as response, open(path, 'wb') as f:
+            shutil.copyfileobj(response, f)
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def vendor_font_awesome(offline):
+    """Fetch the Font Awesome stylesheet and every webfont it references."""
+    css_path = os.path.join(VENDOR_DIR, 'fontawesome', 'css', 'all.min.css')
+    css = fetch(FONT_AWESOME_URL, css_path, offline).decode('utf-8')
+    fonts = {}
+    for _, ref in CSS_URL.findall(css):
+        relative = ref.split('?')[0].split('#')[0]
+        if relative.startswith('data:') or relative in fonts:
+            continue
+        path = os.path.normpath(os.path.join(os.path.dirname(css_path), relative))
+        fonts[relative] = (os.path.basename(path),
+                           fetch(urllib.parse.urljoin(FONT_AWESOME_URL, relative), path, offline))
+    return css, fonts
+
+
+def compile_tailwind():
+    """Run the Tailwind CLI over the templates and return the minified CSS."""
+    command = shlex.split(os.getenv('TAILWINDCSS', TAILWIND_COMMAND))
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'tailwind.css')
+        subprocess.run(command + ['-c', os.path.join(ROOT, 'tailwind.config.js'),
+                                  '-i', os.path.join(ASSETS_DIR, 'tailwind.css'),
+                                  '-o', output, '--minify'], check=True, cwd=ROOT)
+        with open(output, encoding='utf-8') as f:
+            return f.read()
+
+
+def fingerprint(name, data):
+    """Return ``name`` with a short content hash inserted before its extension."""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+
+
+def write_asset(name, data):
+    """Write a fingerprinted asset and its precompressed variants, returning its filename."""
+    filename = fingerprint(name, data)
+    path = os.path.join(DIST_DIR, filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    if filename.endswith(COMPRESSIBLE):
+        with open(path + '.gz', 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            with open(path + '.br', 'wb') as f:
+                f.write(brotli.compress(data, quality=11))
+    return filename
+
+
+def build(offline):
+    """Build static/dist from scratch and return the manifest."""
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    manifest = {}
+
+    chart_js = fetch(CHART_JS_URL, os.path.join(VENDOR_DIR, 'chart.js', 'chart.umd.js'), offline)
+    manifest['chart.js'] = write_asset('chart.js', chart_js)
+
+    font_awesome, fonts = vendor_font_awesome(offline)
+    font_urls = {}
+    for ref, (basename, data) in fonts.items():
+        font_urls[ref] = manifest[f'webfonts/{basename}'] = write_asset(f'webfonts/{basename}', data)
+
+    def rewrite(match):
+        quote, ref = match.groups()
+        relative = ref.split('?')[0].split('#')[0]
+        if relative not in font_urls:
+            return match.group(0)
+        return f'url({quote}{font_urls[relative]}{ref[len(relative):]}{quote})'
+
+    stylesheet = compile_tailwind() + '\n' + CSS_URL.sub(rewrite, font_awesome)
+    manifest['app.css'] = write_asset('app.css', stylesheet.encode('utf-8'))
+
+    with open(os.path.join(DIST_DIR, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the fingerprinted static asset bundle.")
+    parser.add_argument('--offline', action='store_true', help="fail instead of downloading missing vendor files")
+    args = parser.parse_args(argv)
+    manifest = build(args.offline)
+    for name, filename in sorted(manifest.items()):
+        print(f"{name} -> static/dist/{filename}")
+    if brotli is None:
+        print("brotli is not installed, only gzip variants were written", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
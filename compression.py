@@ -0,0 +1,64 @@
+"""Compress dynamic responses with brotli or gzip.
+
+Responses are compressed when the client accepts it, the body is at least
+COMPRESS_MIN_SIZE bytes and the mimetype is text-like. Brotli is preferred when
+the optional ``brotli`` package is installed. Files served by send_file (such
+as the precompressed bundle in static/dist) are left alone.
+"""
+
+import gzip
+import os
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # optional, gzip is used without it
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/javascript', 'application/javascript',
+    'application/json', 'image/svg+xml',
+}
+
+
+def _choose_encoding(accept_encodings):
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+
+def _compress_response(response):
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = _choose_encoding(request.accept_encodings)
+    data = response.get_data()
+    if encoding is None or len(data) < current_app.config['COMPRESS_MIN_SIZE']:
+        return response
+
+    if encoding == 'br':
+        data = brotli.compress(data, quality=current_app.config['COMPRESS_BROTLI_QUALITY'])
+    else:
+        data = gzip.compress(data, compresslevel=current_app.config['COMPRESS_GZIP_LEVEL'])
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    if response.headers.get('ETag'):
+        # The compressed body is a different representation of the resource
+        etag, _ = response.get_etag()
+        response.set_etag(f'{etag}-{encoding}', weak=True)
+    return response
+
+
+def init_app(app):
+    """Register the response compression hook on the application."""
+    app.config.setdefault('COMPRESS_MIN_SIZE', int(os.getenv('COMPRESS_MIN_SIZE', 500)))
+    app.config.setdefault('COMPRESS_GZIP_LEVEL', int(os.getenv('COMPRESS_GZIP_LEVEL', 6)))
+    app.config.setdefault('COMPRESS_BROTLI_QUALITY', int(os.getenv('COMPRESS_BROTLI_QUALITY', 4)))
+    app.after_request(_compress_response)
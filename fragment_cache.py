@@ -0,0 +1,95 @@
+"""Per-user caching of expensive template fragments.
+
+Wrap a template section that only depends on the logged-in user's expenses
+and budget in a call block:
+
+    {% call cached_fragment('expense-rows') %} ... {% endcall %}
+
+The rendered HTML is cached under the fragment name, the user id and the
+user's data version. The version is bumped whenever a transaction that
+inserted, updated or deleted one of that user's tracked rows commits, so a
+stale fragment is never served. The version is read when the request starts,
+before the view loads anything, so data loaded before a concurrent write can
+only ever be cached under the version it was loaded at. Bulk ``db.session.execute`` statements bypass
+this tracking and must call ``bump_data_version`` themselves.
+"""
+
+import itertools
+import os
+import threading
+
+import sqlalchemy
+import sqlalchemy.orm
+from cachetools import LRUCache
+from flask import current_app, g, session
+from markupsafe import Markup
+
+_lock = threading.Lock()
+_versions = {}
+
+
+def data_version(user_id):
+    """Return the current data version of a user."""
+    return _versions.get(user_id, 0)
+
+
+def bump_data_version(user_id):
+    """Invalidate every cached fragment of a user."""
+    with _lock:
+        _versions[user_id] = _versions.get(user_id, 0) + 1
+
+
+def _capture_data_version():
+    user_id = session.get('user_id')
+    g.fragment_data_version = (user_id, data_version(user_id))
+
+
+def cached_fragment(name, *key, caller):
+    """Render the body of a ``{% call %}`` block once per user data version."""
+    user_id = session.get('user_id')
+    captured_user_id, version = g.get('fragment_data_version', (None, None))
+    if version is None or captured_user_id != user_id:
+        # The user changed during the request, so there is no version that is
+        # known to predate the data being rendered
+        return Markup(caller())
+    cache = current_app.extensions['fragment_cache']
+    cache_key = (name, user_id, version) + key
+    with _lock:
+        html = cache.get(cache_key)
+    if html is None:
+        html = Markup(caller())
+        with _lock:
+            try:
+                cache[cache_key] = html
+            except ValueError:  # larger than the whole cache
+                pass
+    return html
+
+
+def init_app(app, models):
+    """Track writes to ``models`` and register ``cached_fragment`` with Jinja.
+
+    Every model in ``models`` must have a ``user_id`` column.
+    """
+    max_chars = int(os.getenv('FRAGMENT_CACHE_CHARS', 32 * 1024 * 1024))
+    app.extensions['fragment_cache'] = LRUCache(maxsize=max_chars, getsizeof=len)
+    app.jinja_env.globals['cached_fragment'] = cached_fragment
+    app.before_request(_capture_data_version)
+    models = tuple(models)
+
+    def collect_touched_users(db_session, flush_context):
+        touched = db_session.info.setdefault('touched_users', set())
+        for obj in itertools.chain(db_session.new, db_session.dirty, db_session.deleted):
+            if isinstance(obj, models) and obj.user_id is not None:
+                touched.add(obj.user_id)
+
+    def invalidate_touched_users(db_session):
+        for user_id in db_session.info.pop('touched_users', ()):
+            bump_data_version(user_id)
+
+    def forget_touched_users(db_session):
+        db_session.info.pop('touched_users', None)
+
+    sqlalchemy.event.listen(sqlalchemy.orm.Session, 'after_flush', collect_touched_users)
+    sqlalchemy.event.listen(sqlalchemy.orm.Session, 'after_commit', invalidate_touched_users)
+    sqlalchemy.event.listen(sqlalchemy.orm.Session, 'after_rollback', forget_touched_users)
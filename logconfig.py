@@ -0,0 +1,185 @@
+"""Non-blocking structured logging for Budget Buddy.
+
+Request threads only put log records on an in-memory queue. A QueueListener
+thread formats them as JSON lines and writes them to a rotating, gzip
+compressed log file (and to stderr for warnings and errors). Every record
+carries the id of the request that produced it.
+
+Configured through environment variables:
+
+    LOG_FILE              path of the log file (default: error.log next to app.py)
+    LOG_LEVEL             minimum level that is logged (default: INFO)
+    LOG_CONSOLE_LEVEL     minimum level also written to stderr (default: WARNING)
+    LOG_MAX_BYTES         rotate when the file reaches this size (default: 10 MB)
+    LOG_ROTATE_WHEN       rotate on a schedule instead, e.g. "midnight" or "H"
+    LOG_BACKUP_COUNT      how many rotated files to keep (default: 7)
+    LOG_INFO_SAMPLE_RATE  fraction of INFO/DEBUG records to keep (default: 1.0)
+    LOG_QUEUE_SIZE        records buffered before new ones are dropped (default: 10000)
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import shutil
+import sys
+import uuid
+from datetime import datetime, timezone
+
+from flask import g, has_request_context, request
+from flask.logging import default_handler
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+# Client supplied request ids end up in every log record, so only short plain ones are trusted
+REQUEST_ID_PATTERN = re.compile(r'[A-Za-z0-9-]{1,64}')
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'request_id'}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including ``extra`` fields."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+            'thread': record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request id to every record logged inside a request."""
+
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = g.get('request_id') if has_request_context() else None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of INFO and DEBUG records.
+
+    Warnings and errors are always kept, as are records logged with
+    ``extra={'audit': True}``.
+    """
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if self.rate >= 1 or record.levelno > logging.INFO or getattr(record, 'audit', False):
+            return True
+        return random.random() < self.rate
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Resolve the message and traceback in the calling thread, but keep them
+        # in separate fields so the JSON formatter can emit them separately.
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+def _gzip_namer(name):
+    return name + '.gz'
+
+
+def _gzip_rotator(source, dest):
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def _file_handler(path):
+    backup_count = int(os.getenv('LOG_BACKUP_COUNT', 7))
+    when = os.getenv('LOG_ROTATE_WHEN')
+    if when:
+        handler = logging.handlers.TimedRotatingFileHandler(path, when=when, backupCount=backup_count,
+                                                            encoding='utf-8', delay=True)
+    else:
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=int(os.getenv('LOG_MAX_BYTES', 10 * 1024 * 1024)),
+                                                       backupCount=backup_count, encoding='utf-8', delay=True)
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def _assign_request_id():
+    request_id = request.headers.get(REQUEST_ID_HEADER, '')
+    g.request_id = request_id if REQUEST_ID_PATTERN.fullmatch(request_id) else uuid.uuid4().hex
+
+
+def _expose_request_id(response):
+    if 'request_id' in g:
+        response.headers.setdefault(REQUEST_ID_HEADER, g.request_id)
+    return response
+
+
+def init_app(app):
+    """Route all logging through a background writer and tag records with request ids."""
+    log_file = os.getenv('LOG_FILE', os.path.join(app.root_path, 'error.log'))
+    formatter = JsonFormatter()
+
+    file_handler = _file_handler(log_file)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(os.getenv('LOG_CONSOLE_LEVEL', 'WARNING').upper())
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(maxsize=int(os.getenv('LOG_QUEUE_SIZE', 10000)))
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(float(os.getenv('LOG_INFO_SAMPLE_RATE', 1.0))))
+    queue_handler.addFilter(RequestIdFilter())
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                              respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # app.logger propagates to the root logger, so Flask, waitress and
+    # SQLAlchemy records all end up on the same queue.
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    app.logger.removeHandler(default_handler)
+
+    app.before_request(_assign_request_id)
+    app.after_request(_expose_request_id)
+    app.extensions['log_listener'] = listener
+    return listener
@@ -0,0 +1,62 @@
+"""Money helpers for Budget Buddy.
+
+Amounts are stored and summed as integer cents so totals are exact. These
+helpers convert between user-entered dollar strings and cents, and format
+cents for display and for the AI prompts.
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+import sqlalchemy
+
+# Largest amount accepted from users, $1 billion. Keeps every value (and any
+# realistic sum of them) well inside SQLite's 64-bit INTEGER.
+MAX_CENTS = 100_000_000_000
+
+
+def parse_cents(value):
+    """Convert a dollar amount such as ``'12.34'`` or ``12.5`` to integer cents.
+
+    Raises ValueError for anything that is not a finite number or whose size
+    exceeds MAX_CENTS.
+    """
+    try:
+        amount = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value!r}") from None
+    if not amount.is_finite() or amount.copy_abs() > Decimal(MAX_CENTS) / 100:
+        raise ValueError(f"Invalid amount: {value!r}")
+    return int((amount * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+
+def format_cents(cents):
+    """Format integer cents as a dollar amount with two decimals, e.g. ``'1234.56'``."""
+    sign = '-' if cents < 0 else ''
+    dollars, remainder = divmod(abs(int(cents)), 100)
+    return f"{sign}{dollars}.{remainder:02d}"
+
+
+def cents_to_dollars(cents):
+    """Convert cents to a float number of dollars for chart data."""
+    return cents / 100
+
+
+def migrate_to_cents(engine, table, old_column, new_column):
+    """Replace a floating-point dollar column by an integer cents column.
+
+    Does nothing once the old column is gone. Returns True when rows were
+    converted.
+    """
+    columns = {column['name'] for column in sqlalchemy.inspect(engine).get_columns(table)}
+    if old_column not in columns:
+        return False
+
+    # pysqlite commits DDL straight away, so a failure part way through can
+    # leave the new column added but not filled in. As long as the old column
+    # is still there the conversion simply runs again.
+    with engine.begin() as conn:
+        if new_column not in columns:
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {new_column} INTEGER NOT NULL DEFAULT 0")
+        conn.exec_driver_sql(f"UPDATE {table} SET {new_column} = CAST(ROUND({old_column} * 100) AS INTEGER)")
+        conn.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN {old_column}")
+    return True
@@ -0,0 +1,168 @@
+"""Opt-in per-request profiling and slow-request logging for Budget Buddy.
+
+Profiling is off by default. It is turned on for every request with
+PROFILE_REQUESTS=1, or for a single request by sending the X-Profile-Token
+header with the value of the PROFILE_TOKEN environment variable. Profiles are
+written as pstats files into a bounded directory that keeps only the newest
+PROFILE_KEEP files.
+
+Independently of profiling, any request slower than SLOW_REQUEST_MS is logged
+as a structured record with its SQL statements and AI call time.
+"""
+
+import cProfile
+import hmac
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+import sqlalchemy
+from flask import current_app, g, has_request_context, request, session
+
+PROFILE_HEADER = 'X-Profile-Token'
+MAX_LOGGED_STATEMENTS = 50
+
+# cProfile cannot run two profilers at once on every Python version we support,
+# so only one request is profiled at a time; concurrent requests are skipped.
+_profile_lock = threading.Lock()
+
+
+def _env_flag(name):
+    return os.getenv(name, '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def _should_profile(app):
+    if app.config['PROFILE_REQUESTS']:
+        return True
+    token = app.config['PROFILE_TOKEN']
+    supplied = request.headers.get(PROFILE_HEADER)
+    # compare_digest only accepts ASCII str, so compare the encoded bytes
+    return bool(token and supplied and hmac.compare_digest(token.encode(), supplied.encode()))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and 'request_stats' in g:
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and 'request_stats' in g:
+        starts = conn.info.get('query_start')
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        g.request_stats['sql'].append((statement, elapsed))
+
+
+@contextmanager
+def track_ai_call():
+    """Time a call to the AI service and attribute it to the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if has_request_context() and 'request_stats' in g:
+            g.request_stats['ai'].append(time.perf_counter() - start)
+
+
+def _write_profile(app, profiler):
+    """Dump a profile into the ring buffer directory and prune the oldest files."""
+    profile_dir = app.config['PROFILE_DIR']
+    os.makedirs(profile_dir, exist_ok=True)
+
+    route = re.sub(r'[^A-Za-z0-9]+', '_', request.path).strip('_') or 'root'
+    filename = f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{uuid.uuid4().hex[:6]}-{route}.prof"
+    path = os.path.join(profile_dir, filename)
+    profiler.dump_stats(path)
+
+    # Always keep at least the profile just written; profiles[:-0] would keep everything
+    keep = max(app.config['PROFILE_KEEP'], 1)
+    profiles = sorted(f for f in os.listdir(profile_dir) if f.endswith('.prof'))
+    for stale in profiles[:max(len(profiles) - keep, 0)]:
+        try:
+            os.remove(os.path.join(profile_dir, stale))
+        except OSError:
+            pass
+    return path
+
+
+def _start_request():
+    g.request_stats = {'start': time.perf_counter(), 'sql': [], 'ai': [], 'profiler': None}
+    if _should_profile(current_app) and _profile_lock.acquire(blocking=False):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            _profile_lock.release()
+            return
+        g.request_stats['profiler'] = profiler
+
+
+def _finish_request(response):
+    stats = g.pop('request_stats', None)
+    if stats is None:
+        return response
+
+    profile_path = None
+    profiler = stats['profiler']
+    if profiler is not None:
+        profiler.disable()
+        _profile_lock.release()
+        try:
+            profile_path = _write_profile(current_app, profiler)
+        except OSError as e:
+            current_app.logger.error("Could not write request profile: %s", e)
+
+    duration = time.perf_counter() - stats['start']
+    if duration * 1000 >= current_app.config['SLOW_REQUEST_MS']:
+        sql = stats['sql']
+        record = {
+            'event': 'slow_request',
+            'method': request.method,
+            'route': request.url_rule.rule if request.url_rule else request.path,
+            'path': request.path,
+            'status': response.status_code,
+            'user_id': session.get('user_id'),
+            'duration_ms': round(duration * 1000, 2),
+            'sql_count': len(sql),
+            'sql_ms': round(sum(elapsed for _, elapsed in sql) * 1000, 2),
+            'sql': [{'statement': statement, 'duration_ms': round(elapsed * 1000, 2)}
+                    for statement, elapsed in sql[:MAX_LOGGED_STATEMENTS]],
+            'ai_calls': len(stats['ai']),
+            'ai_ms': round(sum(stats['ai']) * 1000, 2),
+            'profile': profile_path,
+        }
+        current_app.logger.warning("Slow request: %s %s took %.0f ms", request.method, request.path,
+                                   record['duration_ms'], extra={'slow_request': record})
+
+    return response
+
+
+def _teardown_request(exc):
+    # after_request is skipped when a request fails without a response, so make
+    # sure a running profiler never keeps the lock held.
+    stats = g.pop('request_stats', None)
+    if stats is not None and stats['profiler'] is not None:
+        stats['profiler'].disable()
+        _profile_lock.release()
+
+
+def init_app(app):
+    """Register the profiling hooks and SQL timing listeners on the application."""
+    app.config.setdefault('PROFILE_REQUESTS', _env_flag('PROFILE_REQUESTS'))
+    app.config.setdefault('PROFILE_TOKEN', os.getenv('PROFILE_TOKEN'))
+    app.config.setdefault('PROFILE_DIR', os.getenv('PROFILE_DIR', os.path.join(app.instance_path, 'profiles')))
+    app.config.setdefault('PROFILE_KEEP', int(os.getenv('PROFILE_KEEP', 50)))
+    app.config.setdefault('SLOW_REQUEST_MS', float(os.getenv('SLOW_REQUEST_MS', 1000)))
+
+    if not sqlalchemy.event.contains(sqlalchemy.engine.Engine, 'before_cursor_execute', _before_cursor_execute):
+        sqlalchemy.event.listen(sqlalchemy.engine.Engine, 'before_cursor_execute', _before_cursor_execute)
+        sqlalchemy.event.listen(sqlalchemy.engine.Engine, 'after_cursor_execute', _after_cursor_execute)
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_teardown_request)
@@ -0,0 +1,153 @@
+"""Full-text search over expense names and categories using SQLite FTS5.
+
+``todo_fts`` is a contentless FTS5 index over ``Todo.name`` and ``Todo.item``
+kept in sync by triggers on the todo table. Every indexed word is prefixed
+with its owner (``Groceries`` of user 7 is indexed as ``u7_groceries``), so a
+prefix query only ever walks the doclists of one user's words instead of the
+matches of every user. bm25() is by far the most expensive part of a query,
+so only the MAX_CANDIDATES most recent matches are ranked: a prefix like "s"
+can match tens of thousands of a heavy user's expenses, and scoring them all
+takes tens of milliseconds on a million-row table.
+
+The triggers call the ``fts_scope`` SQL function, which is registered on every
+SQLite connection when this module is imported. Anything else that writes to
+the todo table (e.g. the sqlite3 shell) has to register it too.
+"""
+
+import re
+import sqlite3
+
+import sqlalchemy
+
+FTS_TABLE = 'todo_fts'
+TRIGGERS = ('todo_fts_insert', 'todo_fts_delete', 'todo_fts_update')
+MAX_TERMS = 8
+
+# How many of the newest matching expenses are ranked by relevance
+MAX_CANDIDATES = 500
+
+# What counts as a word, both when indexing and when building a query
+WORD_PATTERN = re.compile(r'\w+')
+
+# bm25() weights for the name and item columns
+RANK_WEIGHTS = '10.0, 5.0'
+
+
+def fts_scope(user_id, text):
+    """Prefix every word of ``text`` with its owner, e.g. ``'u7_rent u7_january'``."""
+    return ' '.join(f'u{user_id}_{word}' for word in WORD_PATTERN.findall(text or ''))
+
+
+def _register_functions(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function('fts_scope', 2, fts_scope, deterministic=True)
+
+
+sqlalchemy.event.listen(sqlalchemy.engine.Engine, 'connect', _register_functions)
+
+
+def _index_values(row):
+    return f"{row}.id, fts_scope({row}.user_id, {row}.name), fts_scope({row}.user_id, {row}.item)"
+
+
+SCHEMA = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        name, item, content='', detail=column, tokenize="unicode61 remove_diacritics 2 tokenchars '_'")""",
+    f"""CREATE TRIGGER todo_fts_insert AFTER INSERT ON todo BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, item) VALUES ({_index_values('new')});
+    END""",
+    f"""CREATE TRIGGER todo_fts_delete AFTER DELETE ON todo BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, item) VALUES ('delete', {_index_values('old')});
+    END""",
+    f"""CREATE TRIGGER todo_fts_update AFTER UPDATE OF name, item, user_id ON todo BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, item) VALUES ('delete', {_index_values('old')});
+        INSERT INTO {FTS_TABLE}(rowid, name, item) VALUES ({_index_values('new')});
+    END""",
+]
+
+
+def is_search_supported(engine):
+    return engine.dialect.name == 'sqlite'
+
+
+def create_search_index(engine):
+    """Create the FTS index and its triggers, rebuilding them if any part is missing or outdated.
+
+    Returns True when the index had to be (re)built.
+    """
+    if not is_search_supported(engine):
+        return False
+
+    with engine.begin() as conn:
+        expected = dict(zip((FTS_TABLE,) + TRIGGERS, SCHEMA))
+        existing = dict(conn.execute(
+            sqlalchemy.text("SELECT name, sql FROM sqlite_master WHERE name IN :names").bindparams(
+                sqlalchemy.bindparam('names', expanding=True)),
+            {'names': list(expected)}).all())
+        if existing == expected:
+            return False
+
+        # Dropping the todo table (e.g. db.drop_all) also drops the triggers,
+        # leaving a stale index behind, and an index built with an older schema
+        # cannot be queried correctly, so always start from scratch.
+        for trigger in TRIGGERS:
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+        for statement in SCHEMA:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}(rowid, name, item) SELECT {_index_values('todo')} FROM todo")
+    return True
+
+
+def build_match_query(user_id, text):
+    """Turn free text into an FTS5 query that prefix-matches every word.
+
+    Returns None if the text contains nothing searchable.
+    """
+    terms = WORD_PATTERN.findall(text)[:MAX_TERMS]
+    if not terms:
+        return None
+    return ' AND '.join(f'"u{int(user_id)}_{term}"*' for term in terms)
+
+
+def search_expenses(conn, user_id, text, date_from=None, date_to=None,
+                    min_cost=None, max_cost=None, limit=50):
+    """Return the user's best matching expenses as rows of (id, item, name, cost_cents, date_created).
+
+    Only the MAX_CANDIDATES newest expenses that match and pass the filters
+    are ranked. ``min_cost`` and ``max_cost`` are in cents.
+    """
+    match = build_match_query(user_id, text)
+    if match is None:
+        return []
+
+    # The FTS index returns matches newest (highest rowid) first without
+    # sorting, so the inner query stops after MAX_CANDIDATES rows and bm25()
+    # is only computed for those
+    sql = [f"""SELECT todo.id, todo.item, todo.name, todo.cost_cents, todo.date_created,
+                      bm25({FTS_TABLE}, {RANK_WEIGHTS}) AS score
+               FROM {FTS_TABLE} JOIN todo ON todo.id = {FTS_TABLE}.rowid
+               WHERE {FTS_TABLE} MATCH :match
+               AND todo.user_id = :user_id"""]
+    # The owner prefix in the MATCH already scopes the search; the user_id check
+    # makes sure an index problem can never leak another user's expenses
+    params = {'match': match, 'user_id': user_id, 'candidates': MAX_CANDIDATES, 'limit': limit}
+    if date_from is not None:
+        sql.append("AND todo.date_created >= :date_from")
+        params['date_from'] = date_from
+    if date_to is not None:
+        sql.append("AND todo.date_created < :date_to")
+        params['date_to'] = date_to
+    if min_cost is not None:
+        sql.append("AND todo.cost_cents >= :min_cost")
+        params['min_cost'] = min_cost
+    if max_cost is not None:
+        sql.append("AND todo.cost_cents <= :max_cost")
+        params['max_cost'] = max_cost
+    sql.append(f"ORDER BY {FTS_TABLE}.rowid DESC LIMIT :candidates")
+    sql = ["SELECT id, item, name, cost_cents, date_created FROM ("] + sql + [
+        ") ORDER BY score, id DESC LIMIT :limit"]
+
+    query = sqlalchemy.text('\n'.join(sql)).bindparams(
+        *(sqlalchemy.bindparam(name, type_=sqlalchemy.DateTime) for name in ('date_from', 'date_to') if name in params))
+    return conn.execute(query.columns(date_created=sqlalchemy.DateTime), params).all()
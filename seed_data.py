@@ -0,0 +1,159 @@
+"""Seeded synthetic data generator for benchmarking Budget Buddy.
+
+Populates the User, Budget and Todo tables of a (separate) database with a
+reproducible data set: the same --seed always produces the same users,
+budgets and expenses.
+
+    python seed_data.py --database sqlite:///bench.db --users 10000 \\
+        --min-expenses 1000 --max-expenses 100000 --reset
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Spending categories offered by the expense forms, with relative frequency,
+# typical cost range and a few item names for each
+CATEGORIES = {
+    'Housing': (2, (600, 2500), ['Rent', 'Mortgage', 'HOA Fee', 'Repairs']),
+    'Utilities': (4, (20, 250), ['Electricity', 'Water', 'Internet', 'Gas Bill']),
+    'Groceries': (20, (5, 180), ['Supermarket', 'Farmers Market', 'Bakery', 'Produce']),
+    'Dining': (15, (6, 90), ['Coffee', 'Lunch', 'Takeout', 'Dinner Out']),
+    'Transportation': (10, (2, 120), ['Fuel', 'Bus Pass', 'Parking', 'Rideshare']),
+    'Insurance': (1, (40, 400), ['Car Insurance', 'Renters Insurance', 'Health Premium']),
+    'Healthcare': (2, (10, 300), ['Pharmacy', 'Doctor Visit', 'Dentist']),
+    'Investments': (1, (50, 1000), ['Index Fund', 'Retirement Contribution']),
+    'Entertainment': (8, (5, 150), ['Movies', 'Concert', 'Video Game', 'Books']),
+    'Clothing': (4, (10, 200), ['Shoes', 'Jacket', 'T-Shirts', 'Jeans']),
+    'Personal Care': (3, (5, 80), ['Haircut', 'Toiletries', 'Skincare']),
+    'Subscriptions': (5, (3, 25), ['Streaming', 'Music', 'Cloud Storage', 'News']),
+    'Travel': (1, (50, 1500), ['Flight', 'Hotel', 'Train Ticket']),
+    'Fitness': (2, (10, 80), ['Gym Membership', 'Yoga Class', 'Protein']),
+    'Pets': (2, (5, 120), ['Pet Food', 'Vet', 'Pet Toys']),
+    'Technology': (2, (10, 1200), ['Headphones', 'Phone Case', 'Laptop', 'Cables']),
+    'Debt': (1, (50, 800), ['Credit Card Payment', 'Student Loan']),
+    'Gifts/Donations': (2, (5, 200), ['Birthday Gift', 'Charity']),
+    'Miscellaneous': (3, (1, 100), ['Household', 'Office Supplies', 'Other']),
+}
+
+# Fixed so that the generated dates do not depend on when the script is run
+DEFAULT_END_DATE = '2025-12-31'
+BENCH_PASSWORD = 'bench123'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Populate a database with synthetic Budget Buddy data.")
+    parser.add_argument('--database', default='sqlite:///bench.db',
+                        help="SQLAlchemy database URI to populate (default: %(default)s)")
+    parser.add_argument('--users', type=int, default=100, help="number of users to create")
+    parser.add_argument('--min-expenses', type=int, default=1000, help="minimum expenses per user")
+    parser.add_argument('--max-expenses', type=int, default=5000, help="maximum expenses per user")
+    parser.add_argument('--days', type=int, default=365, help="how many days of history to spread expenses over")
+    parser.add_argument('--end-date', default=DEFAULT_END_DATE, help="date of the most recent expense (YYYY-MM-DD)")
+    parser.add_argument('--seed', type=int, default=42, help="random seed")
+    parser.add_argument('--batch-size', type=int, default=10000, help="rows per INSERT batch")
+    parser.add_argument('--reset', action='store_true', help="drop and recreate all tables first")
+    args = parser.parse_args(argv)
+    if args.min_expenses > args.max_expenses:
+        parser.error("--min-expenses must not be larger than --max-expenses")
+    return args
+
+
+def generate_expenses(rng, user_id, count, end_date, days):
+    """Yield ``count`` reproducible expense rows for one user."""
+    names = list(CATEGORIES)
+    weights = [CATEGORIES[name][0] for name in names]
+    span = days * 24 * 60 * 60
+    for category in rng.choices(names, weights=weights, k=count):
+        _, (low, high), item_names = CATEGORIES[category]
+        yield {
+            'item': category,
+            'name': rng.choice(item_names),
+            'cost_cents': rng.randint(low * 100, high * 100),
+            'date_created': end_date - timedelta(seconds=rng.randrange(span)),
+            'user_id': user_id,
+        }
+
+
+def seed(args):
+    """Populate the database described by ``args`` and return the row counts."""
+    # app.py reads its configuration at import time. Log to a scratch file
+    # rather than the app's error.log.
+    os.environ['DATABASE_URL'] = args.database
+    os.environ.setdefault('LOG_FILE', os.path.join(tempfile.gettempdir(), 'budgetbuddy-seed.log'))
+
+    import sqlalchemy
+    from werkzeug.security import generate_password_hash
+    from app import app, db, User, Budget, Todo
+    from search import create_search_index
+
+    # If app was imported earlier with a different database, stop here rather
+    # than write to (or with --reset, wipe) the wrong one
+    if app.config['SQLALCHEMY_DATABASE_URI'] != args.database:
+        raise RuntimeError(f"app is configured for {app.config['SQLALCHEMY_DATABASE_URI']}, "
+                           f"not {args.database}; run seed_data.py in a fresh process")
+
+    rng = random.Random(args.seed)
+    end_date = datetime.strptime(args.end_date, '%Y-%m-%d')
+    # Hashing is deliberately slow, so every synthetic user shares one hash
+    password = generate_password_hash(BENCH_PASSWORD, method='pbkdf2:sha256')
+
+    with app.app_context():
+        if args.reset:
+            db.drop_all()
+            db.create_all()
+
+        first_id = (db.session.query(sqlalchemy.func.max(User.id)).scalar() or 0) + 1
+        user_ids = list(range(first_id, first_id + args.users))
+
+        users = [{'id': user_id,
+                  'username': f'bench{user_id:06d}',
+                  'email': f'bench{user_id:06d}@example.com',
+                  'password': password,
+                  'date_created': end_date - timedelta(days=args.days)}
+                 for user_id in user_ids]
+        budgets = [{'user_id': user_id, 'monthly_amount_cents': rng.randrange(1000, 6001, 50) * 100}
+                   for user_id in user_ids]
+        db.session.execute(sqlalchemy.insert(User), users)
+        db.session.execute(sqlalchemy.insert(Budget), budgets)
+        db.session.commit()
+
+        expense_count = 0
+        batch = []
+        started = time.perf_counter()
+        for index, user_id in enumerate(user_ids, 1):
+            count = rng.randint(args.min_expenses, args.max_expenses)
+            for row in generate_expenses(rng, user_id, count, end_date, args.days):
+                batch.append(row)
+                if len(batch) >= args.batch_size:
+                    db.session.execute(sqlalchemy.insert(Todo), batch)
+                    db.session.commit()
+                    expense_count += len(batch)
+                    batch = []
+            if index % 100 == 0 or index == len(user_ids):
+                print(f"{index}/{len(user_ids)} users, {expense_count + len(batch)} expenses "
+                      f"({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+        if batch:
+            db.session.execute(sqlalchemy.insert(Todo), batch)
+            db.session.commit()
+            expense_count += len(batch)
+
+        # --reset drops the todo table together with the search index triggers
+        create_search_index(db.engine)
+
+    return {'users': len(user_ids), 'budgets': len(budgets), 'expenses': expense_count}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    counts = seed(args)
+    print(f"Created {counts['users']} users, {counts['budgets']} budgets and "
+          f"{counts['expenses']} expenses in {args.database}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Serve the fingerprinted asset bundle produced by build_assets.py.
+
+Templates call ``asset_url('app.css')`` to get the URL of the current build of
+an asset. Files in static/dist have content-hash names, so they are served
+with a one year immutable Cache-Control header, and the precompressed .br or
+.gz variant is sent when the client accepts it. When no bundle has been built
+``asset_url`` returns None and templates fall back to the public CDNs.
+"""
+
+import json
+import mimetypes
+import os
+
+from flask import abort, request, send_from_directory, url_for
+
+DIST_FOLDER = 'dist'
+CACHE_SECONDS = 365 * 24 * 60 * 60
+
+# Preferred first; brotli is smaller but only written when it was available at build time
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+
+
+def _load_manifest(dist_dir):
+    try:
+        with open(os.path.join(dist_dir, 'manifest.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def init_app(app):
+    """Register the ``asset_url`` template helper and the static/dist route."""
+    dist_dir = os.path.join(app.static_folder, DIST_FOLDER)
+    manifest = _load_manifest(dist_dir)
+    fingerprinted = set(manifest.values())
+
+    def asset_url(name):
+        filename = manifest.get(name)
+        if filename is None:
+            return None
+        return url_for('dist_asset', filename=filename)
+
+    def dist_asset(filename):
+        path = os.path.join(dist_dir, filename)
+        if not os.path.isfile(path):
+            abort(404)
+
+        immutable = filename in fingerprinted
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        max_age = CACHE_SECONDS if immutable else None
+        for encoding, suffix in PRECOMPRESSED:
+            if request.accept_encodings[encoding] and os.path.isfile(path + suffix):
+                response = send_from_directory(dist_dir, filename + suffix, mimetype=mimetype, max_age=max_age)
+                response.headers['Content-Encoding'] = encoding
+                break
+        else:
+            response = send_from_directory(dist_dir, filename, mimetype=mimetype, max_age=max_age)
+
+        response.vary.add('Accept-Encoding')
+        if immutable:
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+        return response
+
+    app.jinja_env.globals['asset_url'] = asset_url
+    app.add_url_rule(f'{app.static_url_path}/{DIST_FOLDER}/<path:filename>', 'dist_asset', dist_asset)
@@ -0,0 +1,28 @@
+/** Tailwind configuration used by build_assets.py to compile static/dist/app.css. */
+module.exports = {
+    content: ['./templates/**/*.html', './static/scripts/**/*.js'],
+    darkMode: 'class',
+    theme: {
+        extend: {
+            colors: {
+                dark: {
+                    100: '#f3f4f6',
+                    200: '#e5e7eb',
+                    300: '#d1d5db',
+                    400: '#9ca3af',
+                    500: '#6b7280',
+                    600: '#4b5563',
+                    700: '#374151',
+                    800: '#1f2937',
+                    900: '#111827',
+                },
+                google: {
+                    blue: '#4285F4',
+                    red: '#EA4335',
+                    yellow: '#FBBC05',
+                    green: '#34A853'
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,51 @@
+import pytest
+from flask import Flask, render_template_string
+
+import fragment_cache
+
+TEMPLATE = "{% call cached_fragment('rows') %}{{ rows }}{% endcall %}"
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    fragment_cache.init_app(app, models=())
+    app.config['data'] = 'v1'
+    app.config['write_during_request'] = False
+
+    @app.route('/rows')
+    def rows():
+        data = app.config['data']
+        if app.config['write_during_request']:
+            # Another request commits a change after this one loaded its data
+            app.config['data'] = 'v2'
+            fragment_cache.bump_data_version(1)
+            app.config['write_during_request'] = False
+        return render_template_string(TEMPLATE, rows=data)
+
+    return app
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    return client
+
+
+def test_fragment_is_cached_until_the_data_changes(app, client):
+    assert client.get('/rows').text == 'v1'
+    app.config['data'] = 'changed without a version bump'
+    assert client.get('/rows').text == 'v1'
+    fragment_cache.bump_data_version(1)
+    assert client.get('/rows').text == 'changed without a version bump'
+
+
+def test_data_loaded_before_a_concurrent_write_is_not_cached_as_current(app, client):
+    client.get('/rows')
+    fragment_cache.bump_data_version(1)
+    app.config['write_during_request'] = True
+    assert client.get('/rows').text == 'v1'
+    assert client.get('/rows').text == 'v2'
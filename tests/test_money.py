@@ -0,0 +1,92 @@
+import pytest
+import sqlalchemy
+
+from money import MAX_CENTS, format_cents, migrate_to_cents, parse_cents
+
+
+@pytest.mark.parametrize('value, cents', [
+    ('12.34', 1234),
+    (' 3 ', 300),
+    (12.5, 1250),
+    (0.1, 10),
+    ('0.005', 1),
+    ('0.004', 0),
+    ('1.235', 124),
+    ('-1.005', -101),
+    ('-7', -700),
+    ('1e3', 100000),
+    ('1000000000', MAX_CENTS),
+])
+def test_parse_cents(value, cents):
+    assert parse_cents(value) == cents
+
+
+@pytest.mark.parametrize('value', [
+    '', 'abc', '12,34', 'NaN', 'sNaN', 'inf', '-Infinity', float('nan'), float('inf'),
+    '1e20', '1000000000.01', '-1000000000.01', '1e999999999',
+])
+def test_parse_cents_rejects(value):
+    with pytest.raises(ValueError):
+        parse_cents(value)
+
+
+@pytest.mark.parametrize('cents, text', [
+    (0, '0.00'),
+    (5, '0.05'),
+    (1234, '12.34'),
+    (123456789, '1234567.89'),
+    (-5, '-0.05'),
+    (-1234, '-12.34'),
+])
+def test_format_cents(cents, text):
+    assert format_cents(cents) == text
+
+
+def test_format_cents_round_trips():
+    for cents in (-100001, -1, 0, 1, 99, 100, 2000000):
+        assert parse_cents(format_cents(cents)) == cents
+
+
+@pytest.fixture
+def float_db(tmp_path):
+    """A database laid out like the app's before amounts were stored in cents."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE todo (id INTEGER PRIMARY KEY, item VARCHAR(200) NOT NULL, "
+                             "cost FLOAT NOT NULL, user_id INTEGER NOT NULL)")
+        for cost in (0.1, 0.2, 19.99, 1234.565, 3.3, 0.0, -2.5):
+            conn.exec_driver_sql("INSERT INTO todo (item, cost, user_id) VALUES ('Food', ?, 1)", (cost,))
+    yield engine
+    engine.dispose()
+
+
+def test_migrate_to_cents(float_db):
+    assert migrate_to_cents(float_db, 'todo', 'cost', 'cost_cents')
+
+    columns = {column['name']: column for column in sqlalchemy.inspect(float_db).get_columns('todo')}
+    assert 'cost' not in columns
+    assert isinstance(columns['cost_cents']['type'], sqlalchemy.Integer)
+    with float_db.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT cost_cents, typeof(cost_cents) FROM todo ORDER BY id").all()
+        total = conn.exec_driver_sql("SELECT SUM(cost_cents) FROM todo").scalar()
+    assert [cents for cents, _ in rows] == [10, 20, 1999, 123457, 330, 0, -250]
+    assert {kind for _, kind in rows} == {'integer'}
+    assert total == 125566
+
+
+def test_migrate_to_cents_only_runs_once(float_db):
+    assert migrate_to_cents(float_db, 'todo', 'cost', 'cost_cents')
+    assert not migrate_to_cents(float_db, 'todo', 'cost', 'cost_cents')
+    with float_db.connect() as conn:
+        assert conn.exec_driver_sql("SELECT SUM(cost_cents) FROM todo").scalar() == 125566
+
+
+def test_migrate_to_cents_resumes_after_a_failure(float_db):
+    # The column was added, but the conversion never ran
+    with float_db.begin() as conn:
+        conn.exec_driver_sql("ALTER TABLE todo ADD COLUMN cost_cents INTEGER NOT NULL DEFAULT 0")
+
+    assert migrate_to_cents(float_db, 'todo', 'cost', 'cost_cents')
+    assert 'cost' not in {column['name'] for column in sqlalchemy.inspect(float_db).get_columns('todo')}
+    with float_db.connect() as conn:
+        assert conn.exec_driver_sql("SELECT SUM(cost_cents) FROM todo").scalar() == 125566
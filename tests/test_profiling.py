@@ -0,0 +1,32 @@
+import os
+
+import pytest
+from flask import Flask
+
+import profiling
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = Flask(__name__)
+    app.config.update(PROFILE_REQUESTS=False, PROFILE_TOKEN='s3cret', PROFILE_DIR=str(tmp_path))
+    profiling.init_app(app)
+
+    @app.route('/')
+    def index():
+        return 'ok'
+
+    return app.test_client()
+
+
+@pytest.mark.parametrize('supplied', ['café', 'wrong', ''])
+def test_other_tokens_are_not_profiled(client, tmp_path, supplied):
+    response = client.get('/', headers={profiling.PROFILE_HEADER: supplied})
+    assert response.status_code == 200
+    assert os.listdir(tmp_path) == []
+
+
+def test_matching_token_is_profiled(client, tmp_path):
+    response = client.get('/', headers={profiling.PROFILE_HEADER: 's3cret'})
+    assert response.status_code == 200
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.prof')]
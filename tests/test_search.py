@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import pytest
+import sqlalchemy
+
+import search
+from search import create_search_index, search_expenses
+
+TODO_TABLE = """CREATE TABLE todo (
+    id INTEGER PRIMARY KEY,
+    item VARCHAR(200) NOT NULL,
+    name VARCHAR(200) NOT NULL,
+    cost_cents INTEGER NOT NULL,
+    date_created DATETIME,
+    user_id INTEGER NOT NULL)"""
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(TODO_TABLE)
+    create_search_index(engine)
+    yield engine
+    engine.dispose()
+
+
+def add_expense(engine, user_id, item, name, cost_cents=1000):
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text(
+            "INSERT INTO todo (item, name, cost_cents, date_created, user_id) "
+            "VALUES (:item, :name, :cost_cents, :date_created, :user_id)"),
+            {'item': item, 'name': name, 'cost_cents': cost_cents,
+             'date_created': datetime(2025, 1, 15), 'user_id': user_id})
+
+
+def search_names(engine, user_id, text, **filters):
+    with engine.connect() as conn:
+        return [row.name for row in search_expenses(conn, user_id, text, **filters)]
+
+
+@pytest.mark.parametrize('name, query', [
+    ('Rent [January]', 'january'),
+    ('Rent [January]', 'rent jan'),
+    ('Café–Bar tab', 'bar'),
+    ('Café–Bar tab', 'cafe'),
+    ('Trader Joe’s', "joe's"),
+    ('Trader Joe’s', 'trader joe'),
+])
+def test_words_split_by_any_punctuation_are_found(engine, name, query):
+    add_expense(engine, 1, 'Miscellaneous', name)
+    assert search_names(engine, 1, query) == [name]
+
+
+def test_category_words_are_searchable(engine):
+    add_expense(engine, 1, 'Gifts/Donations', 'Charity')
+    assert search_names(engine, 1, 'donations') == ['Charity']
+
+
+def test_results_are_limited_to_the_user(engine):
+    add_expense(engine, 1, 'Groceries', 'Supermarket')
+    add_expense(engine, 2, 'Groceries', 'Supermarket run')
+    assert search_names(engine, 1, 'supermarket') == ['Supermarket']
+    assert search_names(engine, 2, 'supermarket') == ['Supermarket run']
+
+
+def test_results_are_checked_against_the_owner(engine):
+    add_expense(engine, 2, 'Groceries', 'Supermarket')
+    # Simulate a stale index entry that carries the wrong owner prefix
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO todo_fts(rowid, name, item) VALUES (1, 'u1_supermarket', 'u1_groceries')")
+    assert search_names(engine, 1, 'supermarket') == []
+
+
+def test_index_follows_updates_and_deletes(engine):
+    add_expense(engine, 1, 'Dining', 'Lunch')
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE todo SET name = 'Dinner [Friday]'")
+    assert search_names(engine, 1, 'lunch') == []
+    assert search_names(engine, 1, 'friday') == ['Dinner [Friday]']
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM todo")
+    assert search_names(engine, 1, 'friday') == []
+
+
+def test_cost_filters_are_in_cents(engine):
+    add_expense(engine, 1, 'Dining', 'Coffee', cost_cents=450)
+    add_expense(engine, 1, 'Dining', 'Coffee beans', cost_cents=1899)
+    assert search_names(engine, 1, 'coffee', min_cost=500) == ['Coffee beans']
+    assert search_names(engine, 1, 'coffee', max_cost=450) == ['Coffee']
+
+
+def test_existing_rows_are_indexed_on_rebuild(engine):
+    add_expense(engine, 1, 'Housing', 'Rent [March]')
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE todo_fts")
+    assert create_search_index(engine)
+    assert search_names(engine, 1, 'march') == ['Rent [March]']
+
+
+def test_only_the_newest_matches_are_ranked(engine, monkeypatch):
+    monkeypatch.setattr(search, 'MAX_CANDIDATES', 3)
+    for day in range(1, 6):
+        add_expense(engine, 1, 'Dining', f'Coffee {day}')
+    assert sorted(search_names(engine, 1, 'coffee')) == ['Coffee 3', 'Coffee 4', 'Coffee 5']
+    assert search_names(engine, 1, 'coffee 1') == ['Coffee 1']